@@ -6,9 +6,334 @@ All physical actions the robot can perform, called by voice commands.
 Each action is a standalone function that controls servos, motors, and LEDs.
 """
 
+import contextlib
+import functools
+import gc
+import logging
+import logging.handlers
+import os
+import queue
+import sys
 import time
+import types
 import threading
 
+# ─────────────────────────────────────────────────────────────
+# Non-blocking logging — the action worker must never stall on I/O
+# ─────────────────────────────────────────────────────────────
+# print()/direct handlers write synchronously to the TTY or journal and
+# can block for milliseconds mid-gesture. Records are enqueued instead
+# and a background listener thread does the actual writing.
+
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+
+logger = logging.getLogger("okay-robot.actions")
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+logger.propagate = False  # keep records off the main logger's blocking handlers
+
+# ─────────────────────────────────────────────────────────────
+# Interruptible sleep — lets safety events pre-empt actions
+# ─────────────────────────────────────────────────────────────
+# time.sleep() cannot be cancelled, so an emergency stop used to wait
+# for the current action to play out. All action waits go through the
+# abort event instead: setting it wakes every in-flight sleep at once.
+
+_abort = threading.Event()
+
+
+def _sleep(duration):
+    """Interruptible sleep. Returns True if the action was aborted."""
+    return _abort.wait(duration)
+
+
+def abort_actions():
+    """
+    Abort any in-flight action at its next sleep point. Called by the
+    safety monitor before an emergency manoeuvre; the caller is
+    responsible for stopping the motors.
+    """
+    _abort.set()
+    # Give in-flight waits a beat to observe the flag before re-arming,
+    # otherwise a sleeper can miss the set/clear pulse entirely.
+    time.sleep(0.05)
+    _abort.clear()
+
+
+# ─────────────────────────────────────────────────────────────
+# CachedCar — coalesces redundant servo/motor writes
+# ─────────────────────────────────────────────────────────────
+# Every set_*_angle() call is an I2C transaction on the PCA9685, even
+# when the servo is already at the commanded angle. Reset tails like
+# reset_position/look_center re-zero servos that are usually at zero
+# already. This proxy remembers the last commanded value per channel
+# and skips writes whose delta is below _ANGLE_EPSILON, cutting bus
+# traffic that would otherwise contend with ultrasonic/grayscale reads.
+
+_ANGLE_EPSILON = 0.5
+
+class CachedCar:
+    """Thin Picarx proxy that drops writes already reflected on the bus."""
+    __slots__ = ("car", "_dir", "_pan", "_tilt", "_motor")
+
+    def __init__(self, car):
+        self.car = car
+        # Sentinel far outside the servo range so the first write always lands.
+        self._dir = self._pan = self._tilt = 1e9
+        self._motor = None
+
+    def set_dir_servo_angle(self, angle):
+        if abs(angle - self._dir) > _ANGLE_EPSILON:
+            self.car.set_dir_servo_angle(angle)
+            self._dir = angle
+
+    def set_cam_pan_angle(self, angle):
+        if abs(angle - self._pan) > _ANGLE_EPSILON:
+            self.car.set_cam_pan_angle(angle)
+            self._pan = angle
+
+    def set_cam_tilt_angle(self, angle):
+        if abs(angle - self._tilt) > _ANGLE_EPSILON:
+            self.car.set_cam_tilt_angle(angle)
+            self._tilt = angle
+
+    def set_pose(self, steer=None, pan=None, tilt=None):
+        # Multi-channel update for keyframes that move several servos at
+        # the same timestamp. The picarx API offers no autoincrementing
+        # block write, so this issues the per-channel setters back to
+        # back — the cache still drops any channel already in position.
+        if steer is not None:
+            self.set_dir_servo_angle(steer)
+        if pan is not None:
+            self.set_cam_pan_angle(pan)
+        if tilt is not None:
+            self.set_cam_tilt_angle(tilt)
+
+    def forward(self, speed):
+        if self._motor != (1, speed):
+            self.car.forward(speed)
+            self._motor = (1, speed)
+
+    def backward(self, speed):
+        if self._motor != (-1, speed):
+            self.car.backward(speed)
+            self._motor = (-1, speed)
+
+    def stop(self):
+        if self._motor != (0, 0):
+            self.car.stop()
+            self._motor = (0, 0)
+
+    def __getattr__(self, name):
+        # Anything we don't cache (sensors, etc.) goes straight through.
+        return getattr(self.car, name)
+
+
+# ─────────────────────────────────────────────────────────────
+# Keyframe Sequences — deadline-driven motion tables
+# ─────────────────────────────────────────────────────────────
+# Scripted gestures are stored as plain tuples of (t_offset_s, command)
+# where command is ("pan", angle), ("tilt", angle), ("steer", angle),
+# ("pose", steer, pan, tilt), ("fwd", speed), ("bwd", speed), or
+# ("stop",). The driver sleeps to absolute deadlines (t0 + t_offset),
+# so servo-write latency never accumulates across a long sequence the
+# way chained time.sleep() calls do. Keyframes that move several servos
+# at once use "pose" so the update goes out as one coalesced call.
+
+_COMMANDS = {
+    "pan":   "set_cam_pan_angle",
+    "tilt":  "set_cam_tilt_angle",
+    "steer": "set_dir_servo_angle",
+    "pose":  "set_pose",
+    "fwd":   "forward",
+    "bwd":   "backward",
+    "stop":  "stop",
+}
+
+def _repeat_sequence(cycle, repeats, period, start=0.0, lead=(), tail=()):
+    """
+    Unroll a fixed-count oscillation into a flat frame tuple at import:
+    `cycle` frames are stamped out `repeats` times, `period` seconds
+    apart, after any `lead` frames and before any `tail` frames. The
+    repetition cost is paid once at module load instead of per call.
+    """
+    frames = list(lead)
+    for k in range(repeats):
+        base = start + k * period
+        frames.extend((round(base + dt, 3), cmd) for dt, cmd in cycle)
+    frames.extend(tail)
+    return tuple(frames)
+
+
+def _interp_sequence(channel, key_times, key_angles, rate=50):
+    """
+    Upsample keyframe (time, angle) pairs to `rate` Hz with linear
+    interpolation, returning (t_offset, command) frames for
+    run_sequence. Turns step-function keyframe lists into smooth ramps;
+    consecutive samples that round to the same angle are dropped since
+    they would be coalesced away anyway.
+    """
+    frames = []
+    dt = 1.0 / rate
+    steps = int(round(key_times[-1] * rate))
+    seg = 0
+    last_angle = None
+    for i in range(steps + 1):
+        t = i * dt
+        while seg < len(key_times) - 2 and t > key_times[seg + 1]:
+            seg += 1
+        t0, t1 = key_times[seg], key_times[seg + 1]
+        a0, a1 = key_angles[seg], key_angles[seg + 1]
+        frac = 0.0 if t1 == t0 else min(1.0, max(0.0, (t - t0) / (t1 - t0)))
+        angle = round(a0 + (a1 - a0) * frac)
+        if angle != last_angle:
+            frames.append((round(t, 3), (channel, angle)))
+            last_angle = angle
+    return tuple(frames)
+
+
+SEQUENCES = {
+    "shake_head": (
+        (0.00, ("pan", 30)),
+        (0.12, ("pan", -30)),
+        (0.24, ("pan", 20)),
+        (0.36, ("pan", -20)),
+        (0.48, ("pan", 10)),
+        (0.60, ("pan", -10)),
+        (0.72, ("pan", 0)),
+    ),
+    "nod": (
+        (0.00, ("tilt", 20)),
+        (0.20, ("tilt", -10)),
+        (0.40, ("tilt", 15)),
+        (0.60, ("tilt", -5)),
+        (0.80, ("tilt", 0)),
+    ),
+    "wave_hands": (
+        (0.00, ("pose", 25, None, 15)),
+        (0.25, ("steer", -25)),
+        (0.50, ("steer", 25)),
+        (0.75, ("steer", -25)),
+        (1.00, ("pose", 0, None, 0)),
+    ),
+    "think": (
+        (0.00, ("pose", 15, -30, -10)),
+        (1.00, ("pan", -15)),
+        (1.50, ("pose", 0, 0, 0)),
+    ),
+    "celebrate": (
+        (0.00, ("pose", -20, -30, 20)),
+        (0.20, ("pose", 20, 30, None)),
+        (0.40, ("pose", -20, -30, None)),
+        (0.60, ("pose", 20, 30, None)),
+        (0.80, ("pose", 0, 0, 0)),
+    ),
+    "twist_body": _repeat_sequence(
+        cycle=(
+            (0.00, ("fwd", 15)),
+            (0.15, ("stop",)),
+            (0.15, ("pose", -15, 20, None)),
+            (0.30, ("bwd", 15)),
+            (0.45, ("stop",)),
+            (0.45, ("pose", 15, -20, None)),
+        ),
+        repeats=3, period=0.6,
+        tail=((1.80, ("stop",)), (1.80, ("pose", 0, 0, None))),
+    ),
+    "resist": _repeat_sequence(
+        cycle=(
+            (0.00, ("pose", 15, 15, None)),
+            (0.15, ("pose", -15, -15, None)),
+        ),
+        repeats=3, period=0.3,
+        lead=((0.00, ("tilt", 10)),),
+        tail=((0.90, ("stop",)), (0.90, ("pose", 0, 0, 0))),
+    ),
+    "act_cute": _repeat_sequence(
+        cycle=(
+            (0.00, ("fwd", 15)),
+            (0.10, ("stop",)),
+            (0.15, ("bwd", 15)),
+            (0.25, ("stop",)),
+        ),
+        repeats=3, period=0.3, start=0.2,
+        lead=((0.00, ("tilt", -15)),),
+        tail=((1.10, ("tilt", 0)),),
+    ),
+    "rub_hands": _repeat_sequence(
+        cycle=(
+            (0.00, ("steer", 6)),
+            (0.10, ("steer", -6)),
+        ),
+        repeats=5, period=0.2,
+        tail=((1.00, ("steer", 0)),),
+    ),
+    # Smoothly interpolated sad slump — the raw keyframes alone would
+    # jerk the tilt servo between poses.
+    "depressed": _interp_sequence(
+        "tilt",
+        (0.0, 0.4, 0.8, 1.2, 1.6),
+        (-10, -20, -15, -25, -10),
+    ) + ((2.6, ("tilt", 0)),),
+    "dance_intro": (
+        (0.00, ("steer", 25)),
+        (0.00, ("fwd", 20)),
+        (0.30, ("steer", -25)),
+        (0.60, ("steer", 25)),
+        (0.90, ("steer", -25)),
+        (1.20, ("stop",)),
+        (1.20, ("steer", 0)),
+    ),
+}
+
+
+def _concat_sequences(*seqs):
+    """
+    Splice sequences end-to-end by shifting each part's offsets past the
+    previous part's last frame. Pre-flattening compound routines means
+    one deadline-driven loop drives the whole show, with no Python
+    re-entry (and no timing seam) between sub-gestures.
+    """
+    frames = []
+    offset = 0.0
+    for seq in seqs:
+        for dt, cmd in seq:
+            frames.append((round(offset + dt, 3), cmd))
+        offset += seq[-1][0]
+    return tuple(frames)
+
+
+# The full dance routine, flattened at import from its three parts.
+SEQUENCES["dance"] = _concat_sequences(
+    SEQUENCES["dance_intro"],
+    SEQUENCES["wave_hands"],
+    SEQUENCES["celebrate"],
+)
+
+
+def run_sequence(car, seq):
+    """
+    Play a keyframe sequence against absolute deadlines.
+    seq: iterable of (t_offset_s, command) — see SEQUENCES above.
+    """
+    if not isinstance(car, CachedCar):
+        car = CachedCar(car)
+    # Resolve command names to bound methods once per run so the frame
+    # loop is a dict hit and a call, with no per-frame getattr.
+    dispatch = {name: getattr(car, meth) for name, meth in _COMMANDS.items()}
+    monotonic = time.monotonic
+    wait = _abort.wait
+    t0 = monotonic()
+    for dt, cmd in seq:
+        target = t0 + dt
+        if wait(max(0, target - monotonic())):
+            return  # aborted by a safety event
+        dispatch[cmd[0]](*cmd[1:])
+
+
 # ─────────────────────────────────────────────────────────────
 # Action Functions — each takes `car` (Picarx instance)
 # ─────────────────────────────────────────────────────────────
@@ -17,21 +342,21 @@ def forward(car, speed=30, duration=1.0):
     """Drive forward."""
     car.set_dir_servo_angle(0)
     car.forward(speed)
-    time.sleep(duration)
+    _sleep(duration)
     car.stop()
 
 def backward(car, speed=30, duration=1.0):
     """Drive backward."""
     car.set_dir_servo_angle(0)
     car.backward(speed)
-    time.sleep(duration)
+    _sleep(duration)
     car.stop()
 
 def turn_left(car, speed=30, angle=25, duration=1.0):
     """Turn left and drive."""
     car.set_dir_servo_angle(-angle)
     car.forward(speed)
-    time.sleep(duration)
+    _sleep(duration)
     car.stop()
     car.set_dir_servo_angle(0)
 
@@ -39,7 +364,7 @@ def turn_right(car, speed=30, angle=25, duration=1.0):
     """Turn right and drive."""
     car.set_dir_servo_angle(angle)
     car.forward(speed)
-    time.sleep(duration)
+    _sleep(duration)
     car.stop()
     car.set_dir_servo_angle(0)
 
@@ -51,179 +376,128 @@ def stop(car):
 def look_left(car, angle=60):
     """Pan camera left."""
     car.set_cam_pan_angle(angle)
-    time.sleep(0.5)
+    _sleep(0.5)
 
 def look_right(car, angle=60):
     """Pan camera right."""
     car.set_cam_pan_angle(-angle)
-    time.sleep(0.5)
+    _sleep(0.5)
 
 def look_up(car, angle=30):
     """Tilt camera up."""
     car.set_cam_tilt_angle(angle)
-    time.sleep(0.5)
+    _sleep(0.5)
 
 def look_down(car, angle=30):
     """Tilt camera down."""
     car.set_cam_tilt_angle(-angle)
-    time.sleep(0.5)
+    _sleep(0.5)
 
 def look_center(car):
     """Center the camera."""
     car.set_cam_pan_angle(0)
     car.set_cam_tilt_angle(0)
-    time.sleep(0.3)
+    _sleep(0.3)
 
 def shake_head(car):
     """Shake head gesture — 'no'."""
-    for angle in [30, -30, 20, -20, 10, -10, 0]:
-        car.set_cam_pan_angle(angle)
-        time.sleep(0.12)
-    car.set_cam_pan_angle(0)
+    run_sequence(car, SEQUENCES["shake_head"])
 
 def nod(car):
     """Nod gesture — 'yes'."""
-    for angle in [20, -10, 15, -5, 0]:
-        car.set_cam_tilt_angle(angle)
-        time.sleep(0.2)
-    car.set_cam_tilt_angle(0)
+    run_sequence(car, SEQUENCES["nod"])
 
 def wave_hands(car):
     """Playful wave using steering servo as 'arms'."""
-    car.set_cam_tilt_angle(15)
-    for _ in range(2):
-        car.set_dir_servo_angle(25)
-        time.sleep(0.25)
-        car.set_dir_servo_angle(-25)
-        time.sleep(0.25)
-    car.set_dir_servo_angle(0)
-    car.set_cam_tilt_angle(0)
+    run_sequence(car, SEQUENCES["wave_hands"])
 
 def resist(car):
     """Refuse/defensive motion."""
-    car.set_cam_tilt_angle(10)
-    for _ in range(3):
-        car.set_dir_servo_angle(15)
-        car.set_cam_pan_angle(15)
-        time.sleep(0.15)
-        car.set_dir_servo_angle(-15)
-        car.set_cam_pan_angle(-15)
-        time.sleep(0.15)
-    car.stop()
-    car.set_dir_servo_angle(0)
-    car.set_cam_pan_angle(0)
-    car.set_cam_tilt_angle(0)
+    run_sequence(car, SEQUENCES["resist"])
 
 def act_cute(car):
     """Bouncy 'cute' move with micro-shuffles."""
-    car.set_cam_tilt_angle(-15)
-    time.sleep(0.2)
-    for _ in range(3):
-        car.forward(15)
-        time.sleep(0.1)
-        car.stop()
-        time.sleep(0.05)
-        car.backward(15)
-        time.sleep(0.1)
-        car.stop()
-        time.sleep(0.05)
-    car.set_cam_tilt_angle(0)
+    run_sequence(car, SEQUENCES["act_cute"])
 
 def rub_hands(car):
     """Mimics rubbing hands together via steering oscillation."""
-    for _ in range(5):
-        car.set_dir_servo_angle(6)
-        time.sleep(0.1)
-        car.set_dir_servo_angle(-6)
-        time.sleep(0.1)
-    car.set_dir_servo_angle(0)
+    run_sequence(car, SEQUENCES["rub_hands"])
 
 def think(car):
     """Thinking animation — smooth pan + tilt."""
-    car.set_cam_pan_angle(-30)
-    car.set_cam_tilt_angle(-10)
-    car.set_dir_servo_angle(15)
-    time.sleep(1.0)
-    car.set_cam_pan_angle(-15)
-    time.sleep(0.5)
-    car.set_dir_servo_angle(0)
-    car.set_cam_pan_angle(0)
-    car.set_cam_tilt_angle(0)
+    run_sequence(car, SEQUENCES["think"])
 
 def twist_body(car):
     """Body twist — alternating forward/backward with pan/steer."""
-    for _ in range(3):
-        car.forward(15)
-        time.sleep(0.15)
-        car.stop()
-        car.set_cam_pan_angle(20)
-        car.set_dir_servo_angle(-15)
-        time.sleep(0.15)
-        car.backward(15)
-        time.sleep(0.15)
-        car.stop()
-        car.set_cam_pan_angle(-20)
-        car.set_dir_servo_angle(15)
-        time.sleep(0.15)
-    car.stop()
-    car.set_dir_servo_angle(0)
-    car.set_cam_pan_angle(0)
+    run_sequence(car, SEQUENCES["twist_body"])
 
 def celebrate(car):
     """Festive celebration flourish."""
-    car.set_cam_tilt_angle(20)
-    for _ in range(2):
-        car.set_cam_pan_angle(-30)
-        car.set_dir_servo_angle(-20)
-        time.sleep(0.2)
-        car.set_cam_pan_angle(30)
-        car.set_dir_servo_angle(20)
-        time.sleep(0.2)
-    car.set_cam_pan_angle(0)
-    car.set_cam_tilt_angle(0)
-    car.set_dir_servo_angle(0)
+    run_sequence(car, SEQUENCES["celebrate"])
 
 def depressed(car):
     """Sad posture sequence."""
-    for angle in [-10, -20, -15, -25, -10]:
-        car.set_cam_tilt_angle(angle)
-        time.sleep(0.4)
-    time.sleep(1.0)
-    car.set_cam_tilt_angle(0)
+    run_sequence(car, SEQUENCES["depressed"])
+
+# Voice commands call spin_around/patrol with their defaults virtually
+# every time, so the default-argument motion tables are specialized at
+# import; explicit arguments fall back to building frames on the fly.
+_SPIN_DEFAULT = (
+    (0.00, ("steer", 35)),
+    (0.00, ("fwd", 30)),
+    (2.50, ("stop",)),
+    (2.50, ("steer", 0)),
+)
 
 def spin_around(car, speed=30):
     """Spin the car around (360-ish)."""
+    if speed == 30:
+        run_sequence(car, _SPIN_DEFAULT)
+        return
     car.set_dir_servo_angle(35)
     car.forward(speed)
-    time.sleep(2.5)
+    _sleep(2.5)
     car.stop()
     car.set_dir_servo_angle(0)
 
 def dance(car):
     """A fun dance routine combining moves."""
-    for _ in range(2):
-        car.set_dir_servo_angle(25)
-        car.forward(20)
-        time.sleep(0.3)
-        car.set_dir_servo_angle(-25)
-        time.sleep(0.3)
-    car.stop()
-    car.set_dir_servo_angle(0)
-    wave_hands(car)
-    celebrate(car)
+    run_sequence(car, SEQUENCES["dance"])
+
+# Precomputed triangle-wave scan table for patrol(): one full sweep
+# 0 → 45 → -45 → 0 in 5° steps, indexed modulo its length, so the loop
+# body is a single table read instead of per-tick arithmetic plus a
+# direction-reversal branch.
+_PATROL_SCAN = (tuple(range(0, 46, 5))
+                + tuple(range(40, -46, -5))
+                + tuple(range(-40, 0, 5)))
+
+# The default 5 s patrol expanded to a full frame table at import.
+_PATROL_DEFAULT = (
+    ((0.0, ("fwd", 25)),)
+    + tuple((round(i * 0.1, 1), ("pan", _PATROL_SCAN[i % len(_PATROL_SCAN)]))
+            for i in range(50))
+    + ((5.0, ("stop",)), (5.0, ("pan", 0)))
+)
 
 def patrol(car, speed=25, duration=5.0):
     """Patrol mode — drive forward with head scanning."""
+    if speed == 25 and duration == 5.0:
+        run_sequence(car, _PATROL_DEFAULT)
+        return
     car.forward(speed)
-    end_time = time.time() + duration
-    angle = 0
-    direction = 1
-    while time.time() < end_time:
-        car.set_cam_pan_angle(angle)
-        angle += 5 * direction
-        if angle > 45 or angle < -45:
-            direction *= -1
-        time.sleep(0.1)
+    monotonic = time.monotonic
+    wait = _abort.wait
+    deadline = monotonic() + duration
+    i = 0
+    n = len(_PATROL_SCAN)
+    next_t = monotonic()
+    while monotonic() < deadline:
+        car.set_cam_pan_angle(_PATROL_SCAN[i])
+        i = (i + 1) % n
+        next_t += 0.1
+        if wait(max(0, next_t - monotonic())):
+            break
     car.stop()
     car.set_cam_pan_angle(0)
 
@@ -292,17 +566,134 @@ ACTIONS_DICT = {
 }
 
 
+# The alias table is fixed at import, so precompile it once: a frozen
+# normalized mapping for the exact-match fast path, plus a first-word
+# index so near-misses from STT/LLM output ("go forwards") still resolve
+# without scanning all 40+ aliases. Keys are interned so lookups with
+# interned command strings short-circuit on object identity instead of
+# hashing and comparing characters.
+_NORMALIZED = types.MappingProxyType(
+    {sys.intern(k.strip().lower()): v for k, v in ACTIONS_DICT.items()}
+)
+
+_FIRSTWORD = {}
+for _name, _fn in _NORMALIZED.items():
+    _toks = tuple(_name.split())
+    _FIRSTWORD.setdefault(_toks[0], []).append((_toks[1:], _fn))
+del _name, _fn, _toks
+
+
+@functools.lru_cache(maxsize=128)
+def _lookup_action(name):
+    """
+    Resolve an action name to a function, tolerating trailing
+    inflection. Voice sessions repeat the same handful of phrases, so
+    results (including fuzzy-fallback resolutions and misses) are
+    memoized on the raw input string.
+    """
+    # Fast path: LLM/keyword output is usually already normalized, so
+    # try the raw string before paying for strip/lower/split temporaries.
+    fn = _NORMALIZED.get(name)
+    if fn is not None:
+        return fn
+    toks = name.strip().lower().split()
+    if not toks:
+        return None
+    fn = _NORMALIZED.get(sys.intern(" ".join(toks)))
+    if fn is not None:
+        return fn
+    # Fuzzy fallback: exact first word, remaining words may carry
+    # suffixes the recognizer added ("go forwards" → "go forward").
+    for rest, candidate in _FIRSTWORD.get(toks[0], ()):
+        if len(rest) == len(toks) - 1 and all(
+                t.startswith(r) for t, r in zip(toks[1:], rest)):
+            return candidate
+    return None
+
+
+# ─────────────────────────────────────────────────────────────
+# Action worker thread — isolates servo timing from STT/LLM work
+# ─────────────────────────────────────────────────────────────
+# Actions used to run on whichever thread called execute_actions, so
+# servo step timing shared a core with speech recognition and network
+# I/O. A single worker thread drains a queue instead, and on Linux asks
+# for SCHED_FIFO priority and its own CPU (needs CAP_SYS_NICE / root —
+# the service already runs as root; both calls degrade silently).
+
+_action_queue = None
+_worker_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def _rt_section():
+    """
+    Keep the cyclic garbage collector out of a motion sequence — a GC
+    pass mid-gesture shows up as a visible multi-millisecond stutter on
+    the 100–200 ms servo steps. Reference counting still runs, so this
+    only defers collection of cycles until the action finishes.
+    """
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def _lock_memory():
+    # Pin the process's pages so action timing can't take a page-fault
+    # hit mid-sequence. Needs root (which the service has); quietly
+    # skipped elsewhere or when memory is tight.
+    try:
+        import ctypes
+        libc = ctypes.CDLL("libc.so.6", use_errno=True)
+        libc.mlockall(3)  # MCL_CURRENT | MCL_FUTURE
+    except Exception:
+        pass
+
+
+def _action_worker():
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(50))
+    except (AttributeError, PermissionError, OSError):
+        pass
+    try:
+        # Pin to the highest-numbered core so the default core keeps STT.
+        os.sched_setaffinity(0, {max(os.sched_getaffinity(0))})
+    except (AttributeError, OSError):
+        pass
+    if os.name == "posix":
+        _lock_memory()
+    while True:
+        name, fn, car = _action_queue.get()
+        try:
+            with _rt_section():
+                fn(car)
+        except Exception as e:
+            logger.warning("[ACTION ERROR] %s: %s", name, e)
+
+
+def _ensure_worker():
+    global _action_queue
+    with _worker_lock:
+        if _action_queue is None:
+            _action_queue = queue.Queue()
+            t = threading.Thread(target=_action_worker, daemon=True,
+                                 name="action-worker")
+            t.start()
+    return _action_queue
+
+
 def execute_actions(car, action_names):
     """
-    Execute a list of action names sequentially.
-    action_names: list of strings matching keys in ACTIONS_DICT
+    Execute a list of action names sequentially on the action worker
+    thread. action_names: list of strings matching keys in ACTIONS_DICT
     """
+    if not isinstance(car, CachedCar):
+        car = CachedCar(car)
+    q = _ensure_worker()
     for name in action_names:
-        name = name.strip().lower()
-        if name in ACTIONS_DICT:
-            try:
-                ACTIONS_DICT[name](car)
-            except Exception as e:
-                print(f"[ACTION ERROR] {name}: {e}")
+        fn = _lookup_action(name)
+        if fn is not None:
+            q.put((name, fn, car))
         else:
-            print(f"[ACTION] Unknown action: {name}")
+            logger.warning("[ACTION] Unknown action: %s", name)
@@ -57,9 +57,18 @@ Key Bindings:
 
 import sys
 import os
+import errno
+import queue
+import signal
 import threading
 import logging
 import time
+import types
+
+try:
+    from config import HORN_SOUND
+except ImportError:  # dev environment without config.py on the path
+    HORN_SOUND = None
 
 logger = logging.getLogger("okay-robot")
 
@@ -117,6 +126,29 @@ KEY_MAP = {
     "?":       ("help",          "?  Show Help"),
 }
 
+# Mutated never, read constantly: intern the action names so dispatch
+# comparisons are pointer tests, and freeze the table read-only.
+KEY_MAP = types.MappingProxyType(
+    {k: (sys.intern(a), l) for k, (a, l) in KEY_MAP.items()})
+
+# bytes-keyed KEY_MAP so the TTY path never decodes: reads stay raw
+# bytes end-to-end and lookup is one probe. Uppercase variants are added
+# here once instead of lowercasing every keypress.
+_KEY_MAP_B = {}
+for _k, _v in KEY_MAP.items():
+    _KEY_MAP_B[_k.encode("latin1")] = _v
+    if len(_k) == 1 and _k.isalpha():
+        _KEY_MAP_B[_k.upper().encode("latin1")] = _v
+del _k, _v
+
+# 128-entry membership table for single-byte keys: rejecting an
+# unmapped key by array index is cheaper than a dict miss.
+_KEY_TABLE = bytearray(128)
+for _k in _KEY_MAP_B:
+    if len(_k) == 1 and _k[0] < 128:
+        _KEY_TABLE[_k[0]] = 1
+del _k
+
 # ─────────────────────────────────────────────────────────────
 # EVDEV KEY CODE → ACTION MAPPING (systemd / no-TTY mode)
 # ─────────────────────────────────────────────────────────────
@@ -163,10 +195,26 @@ EVDEV_KEY_MAP = {
     1:   ("quit",          "Esc  Quit"),          # KEY_ESC
 }
 
+# Same treatment as KEY_MAP: interned names, read-only view.
+EVDEV_KEY_MAP = types.MappingProxyType(
+    {k: (sys.intern(a), l) for k, (a, l) in EVDEV_KEY_MAP.items()})
 
-def print_help():
-    """Print keyboard control help to console."""
-    msg = """
+# Action names translated to their ACTIONS_DICT spelling ("wave_hands" →
+# "wave hands") once at import, so dispatch never allocates the
+# translated string per key event.
+_PRETTY_NAMES = {
+    name: name.replace("_", " ")
+    for name, _label in set(KEY_MAP.values()) | set(EVDEV_KEY_MAP.values())
+}
+
+# Keys whose auto-repeat events (value==2) are treated as "still held":
+# movement arrows and camera keys, so holding ↑ keeps driving instead of
+# emitting one command and going silent. Gestures/modes stay press-only.
+_REPEATABLE_CODES = frozenset({103, 108, 105, 106, 17, 30, 45, 18})
+
+
+# Help text is static — build it once at import instead of per call.
+_HELP_MSG = """
 ╔══════════════════════════════════════════════╗
 ║       KEYBOARD CONTROLS  (Okay Robot)       ║
 ╠══════════════════════════════════════════════╣
@@ -211,110 +259,277 @@ def print_help():
 ║    ? .................. This Help             ║
 ╚══════════════════════════════════════════════╝
 """
-    logger.info(msg)
-    print(msg)
+
+
+def print_help():
+    """Log keyboard control help (journald/stream-aware, no raw print)."""
+    logger.info(_HELP_MSG)
 
 
 # ═════════════════════════════════════════════════════════════
 # BACKEND 1: TTY MODE (terminal / SSH)
 # ═════════════════════════════════════════════════════════════
 
-def _read_key():
+# Bytes read beyond the current key (paste bursts, key repeat) are kept
+# here and served on the next call instead of going back to the kernel.
+_pending_keys = bytearray()
+
+
+def _read_key_raw(fd):
     """
-    Read a single keypress from stdin (Linux raw terminal mode).
-    Returns the key as a string. Arrow keys return escape sequences.
+    Read a single keypress from a TTY fd already in raw mode.
+    Returns the key as bytes. Arrow keys return escape sequences.
+
+    One os.read grabs the whole pending burst (autorepeat, paste), so a
+    run of N keys costs one syscall and the rest are served from the
+    pushback buffer without re-entering the selector.
     """
+    buf = _pending_keys
+    if not buf:
+        # VMIN=1/VTIME=0: the read returns as soon as anything is
+        # available — a whole burst if one is buffered, a lone Esc by
+        # itself (terminals emit escape sequences atomically).
+        data = os.read(fd, 256)
+        if not data:
+            # True EOF (terminal closed) — surface it as the same errno
+            # the disconnect handler already understands, instead of
+            # returning empty keys and spinning on a readable fd.
+            raise OSError(errno.EIO, "stdin closed")
+        buf += data
+    if buf[:1] == b"\x1b":
+        if len(buf) >= 3 and buf[1:2] == b"[":
+            key = bytes(buf[:3])
+            del buf[:3]
+            return key
+        del buf[:1]
+        return b"\x1b"
+    key = bytes(buf[:1])
+    del buf[:1]
+    return key
+
+
+def _tty_listener(car, state, dispatch_action):
+    """TTY-based keyboard listener (interactive terminal / SSH)."""
     import tty
     import termios
+    import atexit
+
+    logger.info("Keyboard control active (TTY mode). Press '?' for help.")
+    if _has_tty():
+        print_help()
 
+    # Enter raw mode once for the whole session instead of toggling it
+    # around every keypress (3 ioctls per key). Restore on exit; the
+    # atexit hook covers the SIGTERM shutdown path too.
     fd = sys.stdin.fileno()
     old_settings = termios.tcgetattr(fd)
+
+    def _restore():
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+    atexit.register(_restore)
+    tty.setraw(fd)
+
+    # VMIN=1 / VTIME=0: the read blocks in the kernel until a byte
+    # exists and returns the instant one does — no user-space polling
+    # and no timer in the latency path. Escape sequences arrive as one
+    # burst from the terminal, so a single read still captures them.
+    attrs = termios.tcgetattr(fd)
+    attrs[6][termios.VMIN] = 1
+    attrs[6][termios.VTIME] = 0
+    termios.tcsetattr(fd, termios.TCSANOW, attrs)
+
     try:
-        tty.setraw(fd)
-        ch = sys.stdin.read(1)
-        if ch == "\x1b":
-            ch2 = sys.stdin.read(1)
-            if ch2 == "[":
-                ch3 = sys.stdin.read(1)
-                return "\x1b[" + ch3
-            return KEY_ESC
-        return ch
+        _tty_loop(fd, state, dispatch_action)
     finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        _restore()
 
+    logger.info("TTY keyboard listener stopped.")
 
-def _tty_listener(car, state, dispatch_action):
-    """TTY-based keyboard listener (interactive terminal / SSH)."""
-    logger.info("Keyboard control active (TTY mode). Press '?' for help.")
-    print_help()
 
-    while state.running:
-        try:
-            key = _read_key()
-            if key is None:
-                time.sleep(0.1)
-                continue
+def _tty_loop(fd, state, dispatch_action):
+    """
+    Inner TTY key loop — the fd is already in raw mode.
+
+    Waits on a selector covering stdin and the shutdown self-pipe, so
+    notify_shutdown() wakes the loop immediately instead of it sitting
+    in a blocking read until the next keypress.
+    """
+    import selectors
 
-            key_lower = key.lower() if len(key) == 1 else key
+    sel = selectors.DefaultSelector()
+    sel.register(fd, selectors.EVENT_READ)
+    sel.register(_shutdown_rd, selectors.EVENT_READ)
+    try:
+        _tty_select_loop(fd, sel, state, dispatch_action)
+    finally:
+        sel.close()
 
-            # Quit
-            if key_lower in ("q", KEY_ESC):
+
+def _tty_select_loop(fd, sel, state, dispatch_action):
+    while state.running:
+        try:
+            # Buffered bytes from the last burst are served without
+            # touching the selector or the kernel.
+            if not _pending_keys:
+                ready = sel.select()
+                if any(key.fd == _shutdown_rd for key, _ in ready):
+                    os.read(_shutdown_rd, 64)  # drain the wakeup byte(s)
+                    return
+            key = _read_key_raw(fd)
+
+            # Quit — wake every listener via the self-pipe, then nudge
+            # the main thread with SIGTERM since it may be blocked
+            # inside an STT call that only a signal interrupts.
+            if key in (b"q", b"Q", b"\x1b"):
                 logger.info("Keyboard: Quit requested.")
                 state.running = False
-                os.kill(os.getpid(), __import__('signal').SIGTERM)
+                notify_shutdown()
+                os.kill(os.getpid(), signal.SIGTERM)
                 break
 
             # Help
-            if key_lower == "?":
+            if key == b"?":
                 print_help()
                 continue
 
-            # Lookup
-            entry = KEY_MAP.get(key_lower) or KEY_MAP.get(key)
+            # Lookup — every multi-byte key starts with ESC, so a first-
+            # byte test replaces len(): unmapped single-byte keys bail on
+            # an array index before the dict is touched.
+            b0 = key[0]
+            if b0 != 0x1b and b0 < 128 and not _KEY_TABLE[b0]:
+                continue
+            entry = _KEY_MAP_B.get(key)
             if not entry:
                 continue
 
             action_name, label = entry
             dispatch_action(action_name, label)
 
-        except Exception as e:
-            if "I/O" in str(e) or "Errno 5" in str(e) or "Input/output" in str(e):
+        except OSError as e:
+            if e.errno in (errno.EIO, errno.ENXIO):
                 logger.info("Keyboard: Terminal disconnected. TTY mode disabled.")
                 break
             logger.error("Keyboard (TTY) error: %s", e)
             time.sleep(0.5)
-
-    logger.info("TTY keyboard listener stopped.")
+        except Exception as e:
+            logger.error("Keyboard (TTY) error: %s", e)
+            time.sleep(0.5)
 
 
 # ═════════════════════════════════════════════════════════════
 # BACKEND 2: EVDEV MODE (systemd service / no TTY)
 # ═════════════════════════════════════════════════════════════
 
+# Last resolved keyboard path — valid until the device node disappears,
+# so steady-state lookups skip device enumeration entirely.
+_cached_kbd_path = None
+
+
 def _find_keyboard_device():
     """
     Find a keyboard input device in /dev/input/ using evdev.
     Returns the device path or None.
     """
+    global _cached_kbd_path
     try:
         import evdev
     except ImportError:
         return None
 
-    devices = [evdev.InputDevice(path) for path in evdev.list_devices()]
-    for device in devices:
-        capabilities = device.capabilities(verbose=True)
-        # Look for devices that have EV_KEY with typical keyboard keys
-        for cap_type, events in capabilities.items():
-            if cap_type[0] == "EV_KEY":
-                # Check for common keyboard keys (KEY_A=30, KEY_SPACE=57, KEY_UP=103)
-                event_codes = [e[0][1] if isinstance(e[0], tuple) else e[0] for e in events]
-                if 30 in event_codes and 57 in event_codes:
-                    logger.info("Keyboard device found: %s (%s)", device.path, device.name)
-                    return device.path
+    if _cached_kbd_path:
+        if os.path.exists(_cached_kbd_path):
+            return _cached_kbd_path
+        _cached_kbd_path = None  # unplugged — re-enumerate
+
+    for path in evdev.list_devices():
+        try:
+            device = evdev.InputDevice(path)
+        except OSError:
+            continue
+        try:
+            # Raw (non-verbose) capabilities: plain int key codes, no
+            # per-event string pairs. A keyboard has letters and space.
+            keys = device.capabilities().get(evdev.ecodes.EV_KEY, ())
+            if evdev.ecodes.KEY_A in keys and evdev.ecodes.KEY_SPACE in keys:
+                logger.info("Keyboard device found: %s (%s)", path, device.name)
+                _cached_kbd_path = path
+                return path
+        finally:
+            device.close()
     return None
 
 
+# Self-pipe used to wake a blocked evdev selector at shutdown — without
+# it, state.running=False isn't observed until the next keypress.
+_shutdown_rd, _shutdown_wr = os.pipe()
+
+
+def notify_shutdown():
+    """Wake any blocked keyboard listener so it can exit promptly."""
+    try:
+        os.write(_shutdown_wr, b"x")
+    except OSError:
+        pass
+
+
+def _evdev_pump(device, state, dispatch_action):
+    """
+    Drain and dispatch key events from an open evdev device until
+    shutdown or device loss. Each selector wake drains everything the
+    kernel has buffered before sleeping again, so burst input (held or
+    hammered keys) can't back up behind one-event-per-wake dispatch.
+    """
+    import evdev
+    import selectors
+
+    sel = selectors.DefaultSelector()
+    sel.register(device.fd, selectors.EVENT_READ)
+    sel.register(_shutdown_rd, selectors.EVENT_READ)
+
+    ev_key = evdev.ecodes.EV_KEY
+    ev_syn = evdev.ecodes.EV_SYN
+    syn_report = evdev.ecodes.SYN_REPORT
+
+    # Key events accumulated within the current input frame; the kernel
+    # marks frame boundaries with SYN_REPORT, so flushing there gives
+    # the dispatcher whole frames instead of one call per raw event.
+    frame = []
+
+    try:
+        while state.running:
+            ready = sel.select()
+            if any(key.fd == _shutdown_rd for key, _ in ready):
+                os.read(_shutdown_rd, 64)  # drain the wakeup byte(s)
+                return
+            for event in device.read():
+                if event.type == ev_syn and event.code == syn_report:
+                    for action_name, label in frame:
+                        # Quit
+                        if action_name == "quit":
+                            logger.info("Keyboard (evdev): Quit requested.")
+                            state.running = False
+                            notify_shutdown()
+                            os.kill(os.getpid(), signal.SIGTERM)
+                            return
+                        dispatch_action(action_name, label)
+                    del frame[:]
+                    continue
+
+                # Key-down events (value=1) always dispatch; auto-repeat
+                # (value=2) only counts for held movement/camera keys.
+                if event.type != ev_key or event.value == 0:
+                    continue
+                if event.value == 2 and event.code not in _REPEATABLE_CODES:
+                    continue
+
+                entry = EVDEV_KEY_MAP.get(event.code)
+                if entry:
+                    frame.append(entry)
+    finally:
+        sel.close()
+
+
 def _evdev_listener(car, state, dispatch_action):
     """
     evdev-based keyboard listener — reads directly from /dev/input/.
@@ -337,54 +552,80 @@ def _evdev_listener(car, state, dispatch_action):
 
     logger.info("Keyboard control active (evdev mode: %s).", dev_path)
 
+    grabbed = False
     try:
-        import evdev
         device = evdev.InputDevice(dev_path)
-        # Don't grab exclusively — let other processes also read
+        # With no TTY consumer (systemd service) grab the device
+        # exclusively so other readers don't also wake on every event.
+        # Interactive sessions leave it shared.
+        if not _has_tty():
+            try:
+                device.grab()
+                grabbed = True
+            except OSError:
+                pass  # already grabbed elsewhere — keep reading shared
         logger.info("Listening for keyboard events on %s (%s)...", device.path, device.name)
-
-        for event in device.read_loop():
-            if not state.running:
-                break
-
-            # Only handle key-down events (value=1), skip repeats (value=2)
-            if event.type != evdev.ecodes.EV_KEY or event.value != 1:
-                continue
-
-            entry = EVDEV_KEY_MAP.get(event.code)
-            if not entry:
-                continue
-
-            action_name, label = entry
-
-            # Quit
-            if action_name == "quit":
-                logger.info("Keyboard (evdev): Quit requested.")
-                state.running = False
-                os.kill(os.getpid(), __import__('signal').SIGTERM)
-                break
-
-            dispatch_action(action_name, label)
+        _evdev_pump(device, state, dispatch_action)
 
     except OSError as e:
-        logger.warning("Keyboard (evdev) device error: %s. Device may have been unplugged.", e)
+        if e.errno in (errno.ENODEV, errno.ENOENT):
+            logger.info("Keyboard (evdev): Device %s unplugged.", dev_path)
+        else:
+            logger.warning("Keyboard (evdev) device error: %s.", e)
         # Try hotplug loop to wait for reconnection
         if state.running:
             _evdev_hotplug_loop(state, dispatch_action)
     except Exception as e:
         logger.error("Keyboard (evdev) error: %s", e)
+    finally:
+        if grabbed:
+            try:
+                device.ungrab()
+            except OSError:
+                pass
 
     logger.info("evdev keyboard listener stopped.")
 
 
+def _udev_input_monitor():
+    """
+    Build a pyudev monitor on the input subsystem, or None if pyudev
+    isn't installed. With a monitor, hotplug waits sleep on a netlink
+    fd and wake within milliseconds of a real add/remove event instead
+    of re-enumerating /dev/input every few seconds.
+    """
+    try:
+        import pyudev
+        ctx = pyudev.Context()
+        monitor = pyudev.Monitor.from_netlink(ctx)
+        monitor.filter_by("input")
+        monitor.start()
+        return monitor
+    except Exception:
+        return None
+
+
 def _evdev_hotplug_loop(state, dispatch_action):
     """
-    Periodically check for a keyboard device to appear (USB hotplug).
+    Wait for a keyboard device to appear (USB hotplug).
     When found, start the evdev listener for it.
     """
+    import select
+
     logger.info("Keyboard (evdev): Waiting for USB keyboard to be plugged in...")
+    monitor = _udev_input_monitor()
+    if monitor is None:
+        logger.info("Keyboard (evdev): pyudev not available — polling every 5 s.")
+
     while state.running:
-        time.sleep(5)
+        if monitor is not None:
+            # Sleep on the netlink fd; the 30 s timeout is only a
+            # robustness fallback in case an event is missed.
+            select.select([monitor.fileno()], [], [], 30)
+            while monitor.poll(0) is not None:
+                pass  # drain the burst of add/change events
+        else:
+            time.sleep(5)
         dev_path = _find_keyboard_device()
         if dev_path:
             logger.info("Keyboard (evdev): Device detected! Starting listener.")
@@ -392,25 +633,9 @@ def _evdev_hotplug_loop(state, dispatch_action):
             import evdev
             try:
                 device = evdev.InputDevice(dev_path)
-                for event in device.read_loop():
-                    if not state.running:
-                        return
-
-                    if event.type != evdev.ecodes.EV_KEY or event.value != 1:
-                        continue
-
-                    entry = EVDEV_KEY_MAP.get(event.code)
-                    if not entry:
-                        continue
-
-                    action_name, label = entry
-                    if action_name == "quit":
-                        logger.info("Keyboard (evdev): Quit requested.")
-                        state.running = False
-                        os.kill(os.getpid(), __import__('signal').SIGTERM)
-                        return
-
-                    dispatch_action(action_name, label)
+                _evdev_pump(device, state, dispatch_action)
+                if not state.running:
+                    return
 
             except OSError:
                 logger.warning("Keyboard (evdev): Device disconnected. Waiting for reconnect...")
@@ -432,53 +657,155 @@ def _make_dispatcher(car, state, play_sound_func, music,
     """
     from actions import ACTIONS_DICT
 
+    # A plain reference assignment to state.autonomous_mode is atomic
+    # under the GIL, so the mode-set closures skip the lock; only the
+    # cancel path, a compound test-and-clear, still needs it.
+    def _mode_line(label):
+        state.autonomous_mode = "line_track"
+        start_line_tracking()
+        logger.info("[MODE] Line Tracking started. Press 0 to cancel.")
+
+    def _mode_obstacle(label):
+        state.autonomous_mode = "obstacle_avoid"
+        start_obstacle_avoidance()
+        logger.info("[MODE] Obstacle Avoidance started. Press 0 to cancel.")
+
+    def _mode_cancel(label):
+        with state.lock:
+            already_idle = state.autonomous_mode is None
+            state.autonomous_mode = None
+        if already_idle:
+            return  # nothing running — skip the stop/steer I2C writes
+        car.stop()
+        car.set_dir_servo_angle(0)
+        logger.info("[MODE] Autonomous mode cancelled.")
+
+    def _horn(label):
+        play_sound_func(music, HORN_SOUND)
+        logger.info("[SOUND] Honk!")
+
+    table = {
+        "mode_line": _mode_line,
+        "mode_obstacle": _mode_obstacle,
+        "mode_cancel": _mode_cancel,
+        "horn": _horn,
+        "help": lambda label: print_help(),
+    }
+
+    # Resolve every mapped robot action against ACTIONS_DICT once here
+    # (translated spelling first, raw second), so the per-key path is a
+    # single dict probe + call instead of a branch chain.
+    for name, pretty in _PRETTY_NAMES.items():
+        if name in table or name == "quit":
+            continue
+        fn = ACTIONS_DICT.get(pretty) or ACTIONS_DICT.get(name)
+        if fn is not None:
+            def _run(label, _fn=fn):
+                logger.info("[ACTION] %s", label)
+                _fn(car)
+            table[name] = _run
+
+    _get = table.get
+    _trace = logger.isEnabledFor(logging.DEBUG)
+
     def dispatch_action(action_name, label):
-        logger.info("Keyboard: [%s] → %s", label, action_name)
-
-        # Mode commands
-        if action_name == "mode_line":
-            with state.lock:
-                state.autonomous_mode = "line_track"
-            start_line_tracking()
-            logger.info("[MODE] Line Tracking started. Press 0 to cancel.")
-            return
-
-        if action_name == "mode_obstacle":
-            with state.lock:
-                state.autonomous_mode = "obstacle_avoid"
-            start_obstacle_avoidance()
-            logger.info("[MODE] Obstacle Avoidance started. Press 0 to cancel.")
-            return
-
-        if action_name == "mode_cancel":
-            with state.lock:
-                state.autonomous_mode = None
-            car.stop()
-            car.set_dir_servo_angle(0)
-            logger.info("[MODE] Autonomous mode cancelled.")
-            return
-
-        # Horn
-        if action_name == "horn":
-            from config import HORN_SOUND
-            play_sound_func(music, HORN_SOUND)
-            logger.info("[SOUND] Honk!")
-            return
-
-        # Action from ACTIONS_DICT
-        lookup_name = action_name.replace("_", " ")
-        if lookup_name in ACTIONS_DICT:
-            logger.info("[ACTION] %s", label)
-            ACTIONS_DICT[lookup_name](car)
-        elif action_name in ACTIONS_DICT:
-            logger.info("[ACTION] %s", label)
-            ACTIONS_DICT[action_name](car)
+        # The closures emit one user-visible line each ([ACTION]/[MODE]/
+        # [SOUND]); the raw key trace is debug-only so the hot path
+        # writes a single log record per keystroke.
+        if _trace:
+            logger.debug("Keyboard: [%s] → %s", label, action_name)
+        fn = _get(action_name)
+        if fn is not None:
+            fn(label)
         else:
             logger.warning("[UNKNOWN] %s", action_name)
 
     return dispatch_action
 
 
+# Categories whose events can be coalesced: when several stack up, only
+# the most recent steering/camera command needs to reach the robot.
+_MOVEMENT_ACTIONS = frozenset(
+    {"forward", "backward", "turn_left", "turn_right", "stop"})
+_CAMERA_ACTIONS = frozenset(
+    {"look_up", "look_down", "look_left", "look_right", "look_center"})
+_RATE_LIMITED = _MOVEMENT_ACTIONS | _CAMERA_ACTIONS
+
+
+def _coalesce_batch(batch):
+    """
+    Collapse a drained event batch: keep every gesture/mode event in
+    order, but only the newest movement and newest camera command.
+    """
+    kept = []
+    seen = set()
+    for item in reversed(batch):
+        name = item[0]
+        if name in _MOVEMENT_ACTIONS:
+            category = "movement"
+        elif name in _CAMERA_ACTIONS:
+            category = "camera"
+        else:
+            kept.append(item)
+            continue
+        if category not in seen:
+            seen.add(category)
+            kept.append(item)
+    kept.reverse()
+    return kept
+
+
+def _start_dispatch_worker(state, dispatch_action):
+    """
+    Run dispatch on its own worker thread behind a bounded queue, so a
+    long-running action (dance, patrol, sound playback) never stalls
+    the keyboard read loop. Returns the enqueue function the listeners
+    call in place of the dispatcher; under burst load the queue drops
+    new events rather than letting latency grow unbounded.
+    """
+    q = queue.Queue(maxsize=64)
+
+    def worker():
+        last_dispatched = {}  # action_name → monotonic time of last run
+        while state.running:
+            try:
+                item = q.get(timeout=1.0)
+            except queue.Empty:
+                continue
+
+            # Drain whatever queued up behind this event; for
+            # directional input only the newest command per category
+            # matters, so a key-repeat burst collapses to one dispatch.
+            batch = [item]
+            try:
+                while True:
+                    batch.append(q.get_nowait())
+            except queue.Empty:
+                pass
+            if len(batch) > 1:
+                batch = _coalesce_batch(batch)
+
+            for action_name, label in batch:
+                if action_name in _RATE_LIMITED:
+                    now = time.monotonic()
+                    if now - last_dispatched.get(action_name, 0) < 0.05:
+                        continue  # identical command inside the window
+                    last_dispatched[action_name] = now
+                dispatch_action(action_name, label)
+
+    threading.Thread(target=worker, daemon=True,
+                     name="keyboard-dispatch").start()
+
+    def enqueue(action_name, label):
+        try:
+            q.put_nowait((action_name, label))
+        except queue.Full:
+            logger.warning("Keyboard: dispatch queue full — dropping %s",
+                           action_name)
+
+    return enqueue
+
+
 # ═════════════════════════════════════════════════════════════
 # PUBLIC API
 # ═════════════════════════════════════════════════════════════
@@ -508,6 +835,9 @@ def keyboard_listener(car, state, tts_func, play_sound_func, music,
     """
     dispatch = _make_dispatcher(car, state, play_sound_func, music,
                                 start_line_tracking, start_obstacle_avoidance)
+    # Listeners enqueue; the dispatch worker executes. Long actions no
+    # longer block the next key read.
+    dispatch = _start_dispatch_worker(state, dispatch)
 
     # Try evdev first (works both with and without TTY)
     if _has_evdev():
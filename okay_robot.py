@@ -21,11 +21,14 @@ Usage:
 
 import sys
 import os
+import re
 import time
+import functools
+import queue
 import signal
 import threading
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # ─── Fix os.getlogin() for systemd services (no TTY) ────────
 # The picarx library calls os.getlogin() which fails under systemd.
@@ -55,10 +58,14 @@ from config import (
     LOG_FILE, PID_FILE, STARTUP_GREETING,
     KEYBOARD_ENABLED,
 )
-from actions import ACTIONS_DICT, execute_actions, reset_position
-from keyboard_control import start_keyboard_thread
+from actions import ACTIONS_DICT, execute_actions, reset_position, abort_actions, nod
+from keyboard_control import start_keyboard_thread, notify_shutdown
 
 # ─── Logging Setup ───────────────────────────────────────────
+# The safety monitor and autonomous loops log from time-critical
+# threads; a synchronous StreamHandler/file handler can block them for
+# milliseconds on a slow TTY or disk flush. Loggers only enqueue the
+# record — a QueueListener thread does the formatting and I/O.
 logger = logging.getLogger("okay-robot")
 logger.setLevel(logging.INFO)
 _fmt = logging.Formatter("[%(asctime)s] %(levelname)s: %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
@@ -66,23 +73,35 @@ _fmt = logging.Formatter("[%(asctime)s] %(levelname)s: %(message)s", datefmt="%Y
 # Console handler
 _ch = logging.StreamHandler(sys.stdout)
 _ch.setFormatter(_fmt)
-logger.addHandler(_ch)
+_handlers = [_ch]
 
 # File handler (only if we can write to the log path)
 try:
     os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
     _fh = RotatingFileHandler(LOG_FILE, maxBytes=2_000_000, backupCount=3)
     _fh.setFormatter(_fmt)
-    logger.addHandler(_fh)
+    _handlers.append(_fh)
 except PermissionError:
     pass
 
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, *_handlers, respect_handler_level=True)
+_log_listener.start()
+logger.addHandler(QueueHandler(_log_queue))
+
 
 # ═════════════════════════════════════════════════════════════
 # GLOBAL STATE
 # ═════════════════════════════════════════════════════════════
 class RobotState:
-    """Thread-safe shared state for the robot."""
+    """
+    Thread-safe shared state for the robot.
+
+    Single-flag reads and writes (running, awake, too_close, a plain
+    autonomous_mode assignment) are reference-atomic under the GIL, so
+    hot loops touch them lock-free; state.lock is reserved for compound
+    read-modify-write sequences.
+    """
     def __init__(self):
         self.lock = threading.Lock()
         self.running = True           # Master shutdown flag
@@ -91,6 +110,8 @@ class RobotState:
         self.autonomous_mode = None   # "line_track", "obstacle_avoid", "patrol", or None
         self.last_command_time = 0
         self.too_close = False        # Ultrasonic proximity alert
+        self.last_distance = 0.0      # Most recent ultrasonic reading (cm)
+        self.sleep_timer = None       # Inactivity Timer (armed while awake)
 
 state = RobotState()
 
@@ -98,39 +119,87 @@ state = RobotState()
 # ═════════════════════════════════════════════════════════════
 # HARDWARE INITIALIZATION
 # ═════════════════════════════════════════════════════════════
-def init_hardware():
-    """Initialize PiCar-X hardware, STT, TTS, and optional LLM."""
-    logger.info("Initializing PiCar-X hardware...")
+def _tune_stt(stt):
+    """
+    Best-effort decode-speed tuning of the picarx Vosk wrapper.
+
+    If the wrapper keeps a persistent KaldiRecognizer, disabling word
+    timings and n-best alternatives (features we never read) speeds up
+    decoding. The recognizer attribute is probed by the names the
+    wrapper is known to use across versions; everything is optional, so
+    a wrapper that exposes none of them is simply left alone.
+    """
+    for name in ("rec", "recognizer", "_rec", "_recognizer"):
+        rec = getattr(stt, name, None)
+        if rec is None:
+            continue
+        for call in (getattr(rec, "SetMaxAlternatives", None),
+                     getattr(rec, "SetWords", None)):
+            if call is not None:
+                try:
+                    call(0)
+                except Exception as e:
+                    logger.debug("STT tuning skipped: %s", e)
+        break
+
 
-    from picarx import Picarx
-    car = Picarx()
+def init_hardware():
+    """
+    Initialize PiCar-X hardware, STT, TTS, and optional LLM.
 
-    # Set cliff detection reference
-    if CLIFF_DETECTION_ENABLED:
-        car.set_cliff_reference(CLIFF_REFERENCE)
+    The four bring-up steps are independent, so they run concurrently:
+    the 1-3 s Vosk model load overlaps the Picarx/TTS/Music init
+    instead of extending a fully serial boot sequence.
+    """
+    from concurrent.futures import ThreadPoolExecutor
 
-    logger.info("Initializing Vosk STT (language=%s)...", STT_LANGUAGE)
-    from picarx.stt import Vosk
-    stt = Vosk(language=STT_LANGUAGE)
+    logger.info("Initializing PiCar-X hardware...")
 
-    logger.info("Initializing TTS (engine=%s, model=%s)...", TTS_ENGINE, TTS_MODEL)
-    tts = init_tts()
+    def make_car():
+        from picarx import Picarx
+        car = Picarx()
+        # Set cliff detection reference
+        if CLIFF_DETECTION_ENABLED:
+            car.set_cliff_reference(CLIFF_REFERENCE)
+        return car
+
+    def make_stt():
+        logger.info("Initializing Vosk STT (language=%s)...", STT_LANGUAGE)
+        from picarx.stt import Vosk
+        stt = Vosk(language=STT_LANGUAGE)
+        _tune_stt(stt)
+        return stt
+
+    def make_tts():
+        logger.info("Initializing TTS (engine=%s, model=%s)...", TTS_ENGINE, TTS_MODEL)
+        return init_tts()
+
+    def make_music():
+        try:
+            from picarx.music import Music
+            music = Music()
+            music.music_set_volume(50)
+            logger.info("Music/Sound system initialized.")
+            return music
+        except Exception as e:
+            logger.warning("Music system not available: %s", e)
+            return None
 
-    # Optional LLM
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix="init") as pool:
+        car_f = pool.submit(make_car)
+        stt_f = pool.submit(make_stt)
+        tts_f = pool.submit(make_tts)
+        music_f = pool.submit(make_music)
+        car = car_f.result()
+        stt = stt_f.result()
+        tts = tts_f.result()
+        music = music_f.result()
+
+    # Optional LLM (network client — cheap to build, no need to overlap)
     llm = None
     if LLM_ENABLED and LLM_API_KEY:
         llm = init_llm()
 
-    # Music/Sound
-    music = None
-    try:
-        from picarx.music import Music
-        music = Music()
-        music.music_set_volume(50)
-        logger.info("Music/Sound system initialized.")
-    except Exception as e:
-        logger.warning("Music system not available: %s", e)
-
     return car, stt, tts, llm, music
 
 
@@ -186,31 +255,162 @@ def init_llm():
 # ═════════════════════════════════════════════════════════════
 # TEXT-TO-SPEECH HELPER
 # ═════════════════════════════════════════════════════════════
+
+# Mic gate: set = free to listen. say() closes it while TTS is speaking
+# so the background STT thread doesn't transcribe our own voice.
+_mic_gate = threading.Event()
+_mic_gate.set()
+
+
+# Sentence boundaries for incremental TTS feeding.
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+
 def say(tts, text):
-    """Speak the given text."""
+    """Speak the given text, one sentence at a time."""
     if tts is None:
         logger.info("[SAY] %s", text)
         return
+    _mic_gate.clear()
     try:
         logger.info("[SAY] %s", text)
-        tts.say(text)
+        # Piper synthesizes its whole input before any audio plays, so
+        # feeding sentence-sized chunks drops first-audio latency from
+        # O(total text) to O(first sentence) on long responses.
+        for sentence in _SENTENCE_RE.split(text):
+            if sentence:
+                tts.say(sentence)
+            if not state.running:
+                break
     except Exception as e:
         logger.error("TTS error: %s", e)
+    finally:
+        _mic_gate.set()
+
+
+# ═════════════════════════════════════════════════════════════
+# INACTIVITY TIMEOUT — Event-driven instead of per-iteration polling
+# ═════════════════════════════════════════════════════════════
+def _sleep_due(car, tts):
+    """Timer callback: no commands for COMMAND_TIMEOUT_SECONDS."""
+    if not (state.running and state.awake):
+        return  # already asleep or shutting down — stale timer
+    logger.info("Command timeout — going back to sleep.")
+    say(tts, f"I haven't heard anything for a while. Going to sleep. "
+             f"Say 'okay {ROBOT_NAME.lower()}' to wake me again.")
+    with state.lock:
+        state.awake = False
+        state.autonomous_mode = None
+    reset_position(car)
+    reset_llm_session()
+
+
+def arm_sleep_timer(car, tts):
+    """
+    (Re)start the inactivity timer. Fires exactly once after the
+    timeout instead of the main loop re-checking a timestamp on every
+    iteration.
+    """
+    timer = state.sleep_timer
+    if timer is not None:
+        timer.cancel()
+    timer = threading.Timer(COMMAND_TIMEOUT_SECONDS, _sleep_due, args=(car, tts))
+    timer.daemon = True
+    state.sleep_timer = timer
+    timer.start()
+
+
+# ═════════════════════════════════════════════════════════════
+# STT PIPELINE — Background Listener Thread
+# ═════════════════════════════════════════════════════════════
+# Words that trigger an immediate halt from the STT thread itself —
+# waiting for the main loop (which may be mid-TTS) adds up to seconds.
+URGENT_WORDS = frozenset({"stop", "halt", "freeze"})
+
+
+def _urgent_stop(result, car):
+    """
+    Emergency fast path: if a partial or final hypothesis contains an
+    urgent word, stop the car right here on the STT thread. Partial
+    hypotheses (streaming mode) fire before Vosk's end-of-utterance
+    silence wait, cutting roughly a second off voice-to-stop latency.
+    Returns True if a stop was issued.
+    """
+    if isinstance(result, dict):
+        heard = result.get("partial") or result.get("text") or ""
+    else:
+        heard = str(result or "")
+    if not heard or URGENT_WORDS.isdisjoint(heard.lower().split()):
+        return False
+    logger.warning("URGENT: heard %r — stopping immediately.", heard)
+    abort_actions()
+    with state.lock:
+        state.autonomous_mode = None
+    car.stop()
+    car.set_dir_servo_angle(0)
+    return True
+
+
+def start_stt_pump(stt, car):
+    """
+    Run stt.listen() on a background thread so transcription of the
+    next utterance overlaps command execution and TTS, instead of the
+    main loop paying STT + action + speech latency serially.
+    Returns the queue the main loop reads transcripts from.
+    """
+    q = queue.Queue(maxsize=2)
+
+    def pump():
+        while state.running:
+            if not state.awake:
+                # Phase 1 owns the mic for wake-word detection.
+                time.sleep(0.05)
+                continue
+            _mic_gate.wait()
+            try:
+                result = stt.listen(stream=STT_STREAM_MODE)
+            except Exception as e:
+                result = e
+            else:
+                _urgent_stop(result, car)
+            try:
+                q.put(result, timeout=1.0)
+            except queue.Full:
+                pass  # main loop stalled — drop rather than back up
+
+    threading.Thread(target=pump, daemon=True, name="stt-pump").start()
+    return q
 
 
 # ═════════════════════════════════════════════════════════════
 # SOUND EFFECTS
 # ═════════════════════════════════════════════════════════════
+# Absolute paths and existence of the known sound effects, resolved
+# once at import — play_sound makes no filesystem syscalls per call.
+_SOUND_PATHS = {
+    name: path if os.path.exists(path) else None
+    for name, path in ((n, os.path.join(SOUND_DIR, n))
+                       for n in (HORN_SOUND, ENGINE_SOUND))
+}
+
+
 def play_sound(music, filename):
     """Play a sound effect asynchronously."""
     if music is None:
         return
     try:
-        filepath = os.path.join(SOUND_DIR, filename)
-        if os.path.exists(filepath):
+        filepath = _SOUND_PATHS.get(filename)
+        if filepath is None and filename not in _SOUND_PATHS:
+            # Unknown file — resolve and remember it for next time.
+            filepath = os.path.join(SOUND_DIR, filename)
+            if not os.path.exists(filepath):
+                filepath = None
+            _SOUND_PATHS[filename] = filepath
+        if filepath:
             music.sound_play_threading(filepath)
         else:
-            logger.warning("Sound file not found: %s", filepath)
+            logger.warning("Sound file not found: %s",
+                           os.path.join(SOUND_DIR, filename))
     except Exception as e:
         logger.warning("Sound play error: %s", e)
 
@@ -225,50 +425,92 @@ def safety_monitor(car, tts, music):
     - Grayscale sensors (cliff detection)
     """
     logger.info("Safety monitor started.")
+    # Real-time scheduling, same pattern as the action worker in
+    # actions.py: FIFO priority and a pinned core keep emergency-stop
+    # latency bounded when STT/LLM work saturates the other cores. The
+    # priority sits above the action worker's so a stop preempts an
+    # in-flight gesture. Needs CAP_SYS_NICE / root (the service runs as
+    # root); both calls degrade silently elsewhere.
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(60))
+    except (AttributeError, PermissionError, OSError):
+        pass
+    try:
+        os.sched_setaffinity(0, {max(os.sched_getaffinity(0))})
+    except (AttributeError, OSError):
+        pass
+    # Hoisted config/method lookups — the tick body touches only fast
+    # locals instead of repeated module-global and attribute loads.
+    obstacle_enabled = OBSTACLE_AVOIDANCE_ENABLED
+    cliff_enabled = CLIFF_DETECTION_ENABLED
+    too_close_dist = TOO_CLOSE_DISTANCE
+    danger_dist = DANGER_DISTANCE
+    move_speed = MOVE_SPEED
+    read_distance = car.ultrasonic.read
+    read_grayscale = car.get_grayscale_data
+    cliff_status = car.get_cliff_status
+    steer = car.set_dir_servo_angle
+    forward = car.forward
+    backward = car.backward
+    stop = car.stop
+    sleep = time.sleep
+
     while state.running:
         try:
+            emergency = False
+
             # --- Obstacle Avoidance ---
-            if OBSTACLE_AVOIDANCE_ENABLED:
+            if obstacle_enabled:
                 try:
-                    distance = round(car.ultrasonic.read(), 2)
+                    distance = round(read_distance(), 2)
                     if distance > 0:  # Valid reading
-                        if distance < TOO_CLOSE_DISTANCE:
-                            with state.lock:
-                                state.too_close = True
+                        state.last_distance = distance
+                        if distance < too_close_dist:
+                            state.too_close = True
                             logger.warning("TOO CLOSE: %.1f cm — emergency backward!", distance)
-                            car.set_dir_servo_angle(0)
-                            car.backward(MOVE_SPEED)
-                            time.sleep(0.5)
-                            car.stop()
-                        elif distance < DANGER_DISTANCE and state.autonomous_mode == "obstacle_avoid":
-                            car.set_dir_servo_angle(30)
-                            car.forward(MOVE_SPEED)
-                            time.sleep(0.3)
+                            abort_actions()  # wake any in-flight action sleep
+                            steer(0)
+                            backward(move_speed)
+                            sleep(0.5)
+                            stop()
+                            emergency = True
+                        elif distance < danger_dist and state.autonomous_mode == "obstacle_avoid":
+                            steer(30)
+                            forward(move_speed)
+                            sleep(0.3)
                         else:
-                            with state.lock:
-                                state.too_close = False
+                            state.too_close = False
                 except Exception:
                     pass
 
             # --- Cliff Detection ---
-            if CLIFF_DETECTION_ENABLED:
+            # Skipped when the ultrasonic branch already stopped the car
+            # this tick — one sensor read per emergency frame is enough.
+            if cliff_enabled and not emergency:
                 try:
-                    gm_val = car.get_grayscale_data()
-                    if car.get_cliff_status(gm_val):
+                    gm_val = read_grayscale()
+                    if cliff_status(gm_val):
                         logger.warning("CLIFF detected! Backing up.")
-                        car.stop()
-                        car.set_dir_servo_angle(0)
-                        car.backward(MOVE_SPEED)
-                        time.sleep(0.6)
-                        car.stop()
+                        abort_actions()
+                        stop()
+                        steer(0)
+                        backward(move_speed)
+                        sleep(0.6)
+                        stop()
                 except Exception:
                     pass
 
-            time.sleep(0.1)
+            # Adaptive poll rate: tight while something is moving or an
+            # obstacle is near, relaxed while parked — the ~30 ms
+            # ultrasonic read otherwise dominates an idle tick.
+            if state.autonomous_mode or state.too_close:
+                sleep(0.05)
+            else:
+                sleep(0.5)
 
         except Exception as e:
             logger.error("Safety monitor error: %s", e)
-            time.sleep(1)
+            sleep(1)
 
     logger.info("Safety monitor stopped.")
 
@@ -276,51 +518,72 @@ def safety_monitor(car, tts, music):
 # ═════════════════════════════════════════════════════════════
 # AUTONOMOUS MODES
 # ═════════════════════════════════════════════════════════════
+# Grayscale line status → steering decision, precomputed for all eight
+# sensor combinations so the ~100 Hz tracking loop does one dict probe
+# instead of list comparisons and a branch chain per tick.
+_LINE_DECISIONS = {}
+for _a in (0, 1):
+    for _b in (0, 1):
+        for _c in (0, 1):
+            if _b == 1:
+                _d = "forward"
+            elif _a == 1:
+                _d = "right"
+            elif _c == 1:
+                _d = "left"
+            else:
+                _d = "stop"
+            _LINE_DECISIONS[(_a, _b, _c)] = _d
+del _a, _b, _c, _d
+
+
 def line_tracking_loop(car):
     """Line tracking using grayscale sensors."""
     logger.info("Line tracking mode active.")
     last_state = "stop"
+    decisions = _LINE_DECISIONS
+    # Local bindings for the ~100 Hz body — fast-local loads instead of
+    # repeated global and attribute lookups.
+    read_grayscale = car.get_grayscale_data
+    line_status = car.get_line_status
+    steer = car.set_dir_servo_angle
+    forward = car.forward
+    backward = car.backward
+    sleep = time.sleep
+    speed = LINE_TRACK_SPEED
+    offset = LINE_TRACK_OFFSET
+
     while state.running and state.autonomous_mode == "line_track":
         try:
-            gm_val_list = car.get_grayscale_data()
-            _state = car.get_line_status(gm_val_list)
-
-            if _state == [0, 0, 0]:
-                gm_state = "stop"
-            elif _state[1] == 1:
-                gm_state = "forward"
-            elif _state[0] == 1:
-                gm_state = "right"
-            elif _state[2] == 1:
-                gm_state = "left"
-            else:
-                gm_state = "stop"
+            gm_val_list = read_grayscale()
+            _state = line_status(gm_val_list)
+            gm_state = decisions.get(tuple(_state), "stop")
 
             if gm_state != "stop":
                 last_state = gm_state
 
             if gm_state == "forward":
-                car.set_dir_servo_angle(0)
-                car.forward(LINE_TRACK_SPEED)
+                steer(0)
+                forward(speed)
             elif gm_state == "left":
-                car.set_dir_servo_angle(LINE_TRACK_OFFSET)
-                car.forward(LINE_TRACK_SPEED)
+                steer(offset)
+                forward(speed)
             elif gm_state == "right":
-                car.set_dir_servo_angle(-LINE_TRACK_OFFSET)
-                car.forward(LINE_TRACK_SPEED)
+                steer(-offset)
+                forward(speed)
             else:
                 # Out of line — try to recover
                 if last_state == "left":
-                    car.set_dir_servo_angle(-30)
-                    car.backward(10)
+                    steer(-30)
+                    backward(10)
                 elif last_state == "right":
-                    car.set_dir_servo_angle(30)
-                    car.backward(10)
+                    steer(30)
+                    backward(10)
 
-            time.sleep(0.01)
+            sleep(0.01)
         except Exception as e:
             logger.error("Line tracking error: %s", e)
-            time.sleep(0.1)
+            sleep(0.1)
 
     car.stop()
     car.set_dir_servo_angle(0)
@@ -328,37 +591,81 @@ def line_tracking_loop(car):
 
 
 def obstacle_avoid_loop(car):
-    """Autonomous obstacle avoidance driving."""
+    """Autonomous obstacle avoidance driving.
+
+    Runs as a small state machine (forward / swerve / backup). Each
+    state holds for its own deadline on the time.monotonic() clock
+    instead of stacking unconditional sleeps after every decision, and
+    motor/servo commands are only issued when the state changes — the
+    I2C bus is not rewritten with the same values every iteration.
+    Worst-case reaction to a new obstacle drops from ~550 ms to ~50 ms.
+    """
     logger.info("Obstacle avoidance mode active.")
+    read_distance = car.ultrasonic.read
+    steer = car.set_dir_servo_angle
+    forward = car.forward
+    backward = car.backward
+    sleep = time.sleep
+    monotonic = time.monotonic
+
+    # state -> (steer angle, drive fn, hold time before next sensor poll)
+    transitions = {
+        "forward": (0, forward, 0.05),
+        "swerve": (30, forward, 0.1),
+        "backup": (-30, backward, 0.5),
+    }
+    safe_dist = SAFE_DISTANCE
+    danger_dist = DANGER_DISTANCE
+    move_speed = MOVE_SPEED
+
+    mode = None
+    deadline = 0.0
+
     while state.running and state.autonomous_mode == "obstacle_avoid":
         try:
-            distance = round(car.ultrasonic.read(), 2)
+            now = monotonic()
+            if now < deadline:
+                # Short naps so mode cancellation stays responsive.
+                sleep(min(0.02, deadline - now))
+                continue
+
+            distance = round(read_distance(), 2)
             if distance < 0:
-                time.sleep(0.1)
+                deadline = now + 0.1
                 continue
 
-            if distance >= SAFE_DISTANCE:
-                car.set_dir_servo_angle(0)
-                car.forward(MOVE_SPEED)
-            elif distance >= DANGER_DISTANCE:
-                car.set_dir_servo_angle(30)
-                car.forward(MOVE_SPEED)
-                time.sleep(0.1)
+            if distance >= safe_dist:
+                new_mode = "forward"
+            elif distance >= danger_dist:
+                new_mode = "swerve"
             else:
-                car.set_dir_servo_angle(-30)
-                car.backward(MOVE_SPEED)
-                time.sleep(0.5)
-
-            time.sleep(0.05)
+                new_mode = "backup"
+
+            angle, drive, hold = transitions[new_mode]
+            if new_mode != mode:
+                steer(angle)
+                drive(move_speed)
+                mode = new_mode
+            deadline = now + hold
         except Exception as e:
             logger.error("Obstacle avoidance error: %s", e)
-            time.sleep(0.1)
+            deadline = monotonic() + 0.1
 
     car.stop()
     car.set_dir_servo_angle(0)
     logger.info("Obstacle avoidance mode stopped.")
 
 
+def start_line_tracking_thread(car):
+    """Run the line-tracking loop on a background thread."""
+    threading.Thread(target=line_tracking_loop, args=(car,), daemon=True).start()
+
+
+def start_obstacle_avoid_thread(car):
+    """Run the obstacle-avoidance loop on a background thread."""
+    threading.Thread(target=obstacle_avoid_loop, args=(car,), daemon=True).start()
+
+
 # ═════════════════════════════════════════════════════════════
 # COMMAND PROCESSING (Keyword-based)
 # ═════════════════════════════════════════════════════════════
@@ -381,88 +688,170 @@ Example response:
 "Sure, turning left now! ACTIONS: turn_left"
 """
 
+# Persistent LLM chat session, one per wake cycle. Providers that
+# support stateful conversations receive the (multi-hundred-token)
+# system prompt once when the session opens instead of re-sending and
+# re-tokenizing it on every turn.
+_llm_session = None
 
-def process_command_keyword(text, car, tts, music):
-    """
-    Process voice command using keyword matching.
-    Returns True if a command was handled, False otherwise.
+
+def _llm_session_for(llm):
+    """Open (or reuse) a stateful chat session if the provider has one.
+
+    Duck-typed on a start_chat() factory, like the stream_chat probe in
+    process_command_llm. Returns None for stateless providers, which
+    keep the pass-system-every-call path.
     """
-    text = text.lower().strip()
-    if not text:
-        return False
+    global _llm_session
+    if _llm_session is None:
+        start_chat = getattr(llm, "start_chat", None)
+        if start_chat is not None:
+            try:
+                _llm_session = start_chat(system=LLM_SYSTEM_PROMPT)
+            except Exception as e:
+                logger.debug("Stateful chat unavailable: %s", e)
+    return _llm_session
 
-    logger.info("[HEARD] %s", text)
 
-    # --- Sleep / Go back to waiting ---
-    if any(w in text for w in ["sleep", "go to sleep", "goodbye", "bye"]):
-        say(tts, f"Going to sleep. Say 'okay {ROBOT_NAME.lower()}' to wake me again.")
-        reset_position(car)
-        with state.lock:
-            state.awake = False
-            state.autonomous_mode = None
-        return True
+def reset_llm_session():
+    """Drop conversation state at the sleep/wake boundary."""
+    global _llm_session
+    _llm_session = None
 
-    # --- Stop autonomous mode ---
-    if any(w in text for w in ["stop mode", "cancel mode", "exit mode", "normal mode"]):
-        with state.lock:
-            state.autonomous_mode = None
-        car.stop()
-        car.set_dir_servo_angle(0)
-        say(tts, "Autonomous mode stopped. I'm listening for commands.")
-        return True
 
-    # --- Enter line tracking mode ---
-    if any(w in text for w in ["line tracking", "track line", "follow line", "line track", "follow the line"]):
-        say(tts, "Starting line tracking mode. Say stop to exit.")
-        with state.lock:
-            state.autonomous_mode = "line_track"
-        t = threading.Thread(target=line_tracking_loop, args=(car,), daemon=True)
-        t.start()
-        return True
+# "ACTIONS: ..." line in an LLM response, compiled once — one C-level
+# scan of the response instead of a Python loop over its lines.
+ACTIONS_RE = re.compile(r"^\s*ACTIONS:\s*(.*)$", re.I | re.M)
 
-    # --- Enter obstacle avoidance mode ---
-    if any(w in text for w in ["obstacle avoidance", "avoid obstacles", "obstacle mode", "avoid mode"]):
-        say(tts, "Starting obstacle avoidance mode. Say stop to exit.")
-        with state.lock:
-            state.autonomous_mode = "obstacle_avoid"
-        t = threading.Thread(target=obstacle_avoid_loop, args=(car,), daemon=True)
-        t.start()
-        return True
+# Action-keyword matcher compiled once at import: one C-level scan of
+# the utterance instead of a per-call sort plus a substring search per
+# action name. Longest-first alternation plus the max() below preserve
+# the old longest-keyword-wins behavior.
+_ACTION_KEYWORD_RE = re.compile(
+    "|".join(map(re.escape, sorted(ACTIONS_DICT, key=len, reverse=True))))
 
-    # --- Sound effects ---
-    if any(w in text for w in ["honk", "horn", "beep"]):
-        play_sound(music, HORN_SOUND)
-        say(tts, "Beep beep!")
-        return True
 
-    if any(w in text for w in ["start engine", "engine"]):
-        play_sound(music, ENGINE_SOUND)
-        say(tts, "Vroom vroom!")
-        return True
+def _phrase_re(*phrases):
+    """Compile a phrase group into one alternation for a single scan."""
+    return re.compile("|".join(map(re.escape, phrases)))
 
-    # --- Status / Help ---
-    if any(w in text for w in ["status", "how are you", "what's up"]):
-        try:
-            dist = round(car.ultrasonic.read(), 2)
-            say(tts, f"I'm doing great! Distance ahead is {dist} centimeters.")
-        except Exception:
-            say(tts, "I'm doing great and ready for commands!")
-        return True
 
-    if any(w in text for w in ["help", "what can you do", "commands"]):
-        say(tts, "I can go forward, backward, turn left or right, look around, "
-                 "dance, celebrate, patrol, track lines, avoid obstacles, and more! "
-                 "Just tell me what to do.")
-        return True
+# Phrase-group matchers, compiled once — each replaces an any()-over-
+# list of Python-level substring scans per utterance.
+WAKE_RE = _phrase_re(*WAKE_WORDS)
+SLEEP_RE = _phrase_re("sleep", "go to sleep", "goodbye", "bye")
+STOP_MODE_RE = _phrase_re("stop mode", "cancel mode", "exit mode", "normal mode")
+LINE_RE = _phrase_re("line tracking", "track line", "follow line",
+                     "line track", "follow the line")
+OBST_RE = _phrase_re("obstacle avoidance", "avoid obstacles",
+                     "obstacle mode", "avoid mode")
+HORN_RE = _phrase_re("honk", "horn", "beep")
+ENGINE_RE = _phrase_re("start engine", "engine")
+STATUS_RE = _phrase_re("status", "how are you", "what's up")
+HELP_RE = _phrase_re("help", "what can you do", "commands")
 
-    # --- Stop (high priority) ---
-    if text in ["stop", "halt", "freeze"]:
-        with state.lock:
-            state.autonomous_mode = None
-        car.stop()
-        car.set_dir_servo_angle(0)
-        say(tts, "Stopped!")
-        return True
+
+# --- Phrase-group handlers, one small function per branch ---
+
+# Whole-utterance urgent stop ("stop"/"halt"/"freeze" and nothing else).
+HARD_STOP_RE = re.compile(r"^(?:stop|halt|freeze)$")
+
+
+def _handle_hard_stop(text, car, tts, music):
+    with state.lock:
+        state.autonomous_mode = None
+    car.stop()
+    car.set_dir_servo_angle(0)
+    say(tts, "Stopped!")
+
+
+def _handle_sleep(text, car, tts, music):
+    say(tts, f"Going to sleep. Say 'okay {ROBOT_NAME.lower()}' to wake me again.")
+    reset_position(car)
+    with state.lock:
+        state.awake = False
+        state.autonomous_mode = None
+
+
+def _handle_stop_mode(text, car, tts, music):
+    with state.lock:
+        state.autonomous_mode = None
+    car.stop()
+    car.set_dir_servo_angle(0)
+    say(tts, "Autonomous mode stopped. I'm listening for commands.")
+
+
+def _handle_line_track(text, car, tts, music):
+    say(tts, "Starting line tracking mode. Say stop to exit.")
+    with state.lock:
+        state.autonomous_mode = "line_track"
+    start_line_tracking_thread(car)
+
+
+def _handle_obstacle(text, car, tts, music):
+    say(tts, "Starting obstacle avoidance mode. Say stop to exit.")
+    with state.lock:
+        state.autonomous_mode = "obstacle_avoid"
+    start_obstacle_avoid_thread(car)
+
+
+def _handle_horn(text, car, tts, music):
+    play_sound(music, HORN_SOUND)
+    say(tts, "Beep beep!")
+
+
+def _handle_engine(text, car, tts, music):
+    play_sound(music, ENGINE_SOUND)
+    say(tts, "Vroom vroom!")
+
+
+def _handle_status(text, car, tts, music):
+    # The safety monitor polls the ultrasonic sensor continuously; use
+    # its cached reading instead of a second ~30 ms blocking read.
+    dist = state.last_distance
+    if dist > 0:
+        say(tts, f"I'm doing great! Distance ahead is {dist} centimeters.")
+    else:
+        say(tts, "I'm doing great and ready for commands!")
+
+
+def _handle_help(text, car, tts, music):
+    say(tts, "I can go forward, backward, turn left or right, look around, "
+             "dance, celebrate, patrol, track lines, avoid obstacles, and more! "
+             "Just tell me what to do.")
+
+
+# Ordered (matcher, handler) table — the urgent stop is first so it
+# short-circuits ahead of everything else; the rest keep their
+# historical precedence.
+_COMMAND_HANDLERS = (
+    (HARD_STOP_RE, _handle_hard_stop),
+    (SLEEP_RE, _handle_sleep),
+    (STOP_MODE_RE, _handle_stop_mode),
+    (LINE_RE, _handle_line_track),
+    (OBST_RE, _handle_obstacle),
+    (HORN_RE, _handle_horn),
+    (ENGINE_RE, _handle_engine),
+    (STATUS_RE, _handle_status),
+    (HELP_RE, _handle_help),
+)
+
+
+def process_command_keyword(text, car, tts, music):
+    """
+    Process voice command using keyword matching.
+    Returns True if a command was handled, False otherwise.
+    """
+    text = text.lower().strip()
+    if not text:
+        return False
+
+    logger.info("[HEARD] %s", text)
+
+    for matcher, handler in _COMMAND_HANDLERS:
+        if matcher.search(text):
+            handler(text, car, tts, music)
+            return True
 
     # --- Try action dictionary for single/compound commands ---
     # Check for exact matches first
@@ -471,16 +860,46 @@ def process_command_keyword(text, car, tts, music):
         ACTIONS_DICT[text](car)
         return True
 
-    # Check for keywords within the text
-    for keyword in sorted(ACTIONS_DICT.keys(), key=len, reverse=True):
-        if keyword in text:
-            say(tts, f"Got it, {keyword}!")
-            ACTIONS_DICT[keyword](car)
-            return True
+    # Check for keywords within the text — longest match wins
+    match = max(_ACTION_KEYWORD_RE.finditer(text),
+                key=lambda m: m.end() - m.start(), default=None)
+    if match:
+        keyword = match.group()
+        say(tts, f"Got it, {keyword}!")
+        ACTIONS_DICT[keyword](car)
+        return True
 
     return False
 
 
+def _speak_llm_stream(chunks, tts):
+    """
+    Speak an LLM token stream sentence-by-sentence as it arrives, so
+    first audio starts after the first sentence instead of after the
+    full response. Lines starting with ACTIONS: are held back for the
+    caller to parse. Returns the complete response text.
+    """
+    full = []
+    buf = ""
+    for chunk in chunks:
+        full.append(chunk)
+        buf += chunk
+        while True:
+            m = _SENTENCE_RE.search(buf)
+            if m is None:
+                break
+            sentence, buf = buf[:m.start()], buf[m.end():]
+            sentence = sentence.strip()
+            if sentence and not sentence.upper().startswith("ACTIONS:"):
+                say(tts, sentence)
+    # Flush whatever trails the last sentence boundary.
+    for line in buf.split("\n"):
+        line = line.strip()
+        if line and not line.upper().startswith("ACTIONS:"):
+            say(tts, line)
+    return "".join(full)
+
+
 def process_command_llm(text, car, tts, llm, music):
     """
     Process voice command using LLM for natural language understanding.
@@ -496,15 +915,16 @@ def process_command_llm(text, car, tts, llm, music):
     logger.info("[HEARD-LLM] %s", text)
 
     # Still handle sleep/stop locally
-    if any(w in text for w in ["sleep", "go to sleep", "goodbye", "bye"]):
+    if SLEEP_RE.search(text):
         say(tts, f"Going to sleep. Say 'okay {ROBOT_NAME.lower()}' to wake me again.")
         reset_position(car)
+        reset_llm_session()
         with state.lock:
             state.awake = False
             state.autonomous_mode = None
         return True
 
-    if text in ["stop", "halt", "freeze"]:
+    if text in URGENT_WORDS:
         with state.lock:
             state.autonomous_mode = None
         car.stop()
@@ -517,16 +937,31 @@ def process_command_llm(text, car, tts, llm, music):
         is_too_close = state.too_close
 
     if is_too_close:
-        try:
-            dist = round(car.ultrasonic.read(), 2)
-        except Exception:
-            dist = 0
+        # Cached by the safety monitor — no extra blocking sensor read.
+        dist = state.last_distance
         text = f"<<<Ultrasonic sense too close: {dist}cm>>> " + text
 
-    # Query LLM
+    # Query LLM — a stateful session already carries the system prompt;
+    # stream if the wrapper supports it, speaking sentences as they
+    # arrive; otherwise fall back to the blocking call.
+    session = _llm_session_for(llm)
+    target = session if session is not None else llm
+    stream_chat = getattr(target, "stream_chat", None)
+    already_spoken = False
     try:
         logger.info("[LLM] Sending to %s...", LLM_PROVIDER)
-        response = llm.chat(text, system=LLM_SYSTEM_PROMPT)
+        if session is not None:
+            if stream_chat is not None:
+                response = _speak_llm_stream(stream_chat(text), tts)
+                already_spoken = True
+            else:
+                response = session.chat(text)
+        elif stream_chat is not None:
+            response = _speak_llm_stream(
+                stream_chat(text, system=LLM_SYSTEM_PROMPT), tts)
+            already_spoken = True
+        else:
+            response = llm.chat(text, system=LLM_SYSTEM_PROMPT)
         logger.info("[LLM RESPONSE] %s", response)
     except Exception as e:
         logger.error("LLM error: %s", e)
@@ -534,23 +969,17 @@ def process_command_llm(text, car, tts, llm, music):
         # Fall back to keyword matching
         return process_command_keyword(text, car, tts, music)
 
-    # Parse response — split speech from actions
-    speech_parts = []
+    # Parse response — one compiled scan splits speech from actions.
+    # Underscores become spaces for the ACTIONS_DICT lookup.
     action_names = []
-    for line in response.split("\n"):
-        line = line.strip()
-        if line.upper().startswith("ACTIONS:"):
-            action_str = line[len("ACTIONS:"):].strip()
-            action_names = [a.strip().lower().replace(" ", "_") for a in action_str.split(",")]
-            # Convert underscores back to spaces for action lookup
-            action_names = [a.replace("_", " ") for a in action_names]
-        else:
-            if line:
-                speech_parts.append(line)
-
-    # Speak the response
-    speech_text = " ".join(speech_parts)
-    if speech_text:
+    m = ACTIONS_RE.search(response)
+    if m:
+        action_names = [a.strip().lower().replace("_", " ")
+                        for a in m.group(1).split(",") if a.strip()]
+
+    # Speak the response (unless the streaming path already did)
+    speech_text = " ".join(ACTIONS_RE.sub("", response).split())
+    if speech_text and not already_spoken:
         say(tts, speech_text)
 
     # Execute actions
@@ -587,6 +1016,9 @@ def main():
         logger.info("Shutdown signal received.")
         state.running = False
         state.autonomous_mode = None
+        if state.sleep_timer is not None:
+            state.sleep_timer.cancel()
+        notify_shutdown()  # wake any blocked keyboard listener
         try:
             car.stop()
             car.set_dir_servo_angle(0)
@@ -606,35 +1038,31 @@ def main():
     safety_thread = threading.Thread(target=safety_monitor, args=(car, tts, music), daemon=True)
     safety_thread.start()
 
-    # Play startup sound and greeting
+    # Play startup sound and greeting — the engine sound plays on its
+    # own thread, so the greeting overlaps it instead of waiting.
     play_sound(music, ENGINE_SOUND)
-    time.sleep(1)
     say(tts, STARTUP_GREETING)
     logger.info("System ready. Waiting for wake word...")
 
     # ─── Start keyboard control thread ───
     if KEYBOARD_ENABLED:
-        def _start_line_tracking():
-            t = threading.Thread(target=line_tracking_loop, args=(car,), daemon=True)
-            t.start()
-
-        def _start_obstacle_avoidance():
-            t = threading.Thread(target=obstacle_avoid_loop, args=(car,), daemon=True)
-            t.start()
-
         start_keyboard_thread(
             car=car,
             state=state,
             tts_func=lambda text: say(tts, text),
             play_sound_func=play_sound,
             music=music,
-            start_line_tracking=_start_line_tracking,
-            start_obstacle_avoidance=_start_obstacle_avoidance,
+            start_line_tracking=functools.partial(start_line_tracking_thread, car),
+            start_obstacle_avoidance=functools.partial(start_obstacle_avoid_thread, car),
         )
 
     # Choose command processor
     process_command = process_command_llm if (LLM_ENABLED and llm) else process_command_keyword
 
+    # Background STT thread — transcribes the next utterance while the
+    # current command is still executing/speaking.
+    stt_queue = start_stt_pump(stt, car)
+
     # ─── Main Loop ───
     try:
         while state.running:
@@ -651,53 +1079,55 @@ def main():
                 if not state.running:
                     break
 
+                # Discard any transcript left over from the last session
+                # before the pump starts filling the queue again.
+                try:
+                    while True:
+                        stt_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
                 with state.lock:
                     state.awake = True
                     state.last_command_time = time.time()
 
                 logger.info("Wake word detected!")
+                arm_sleep_timer(car, tts)
                 say(tts, f"Hi there! I'm {ROBOT_NAME}. What would you like me to do?")
-                nod_thread = threading.Thread(target=lambda: __import__('actions').nod(car), daemon=True)
-                nod_thread.start()
+                threading.Thread(target=nod, args=(car,), daemon=True).start()
 
             # ─── Phase 2: Command loop ───
             with state.lock:
                 state.listening = True
 
             while state.running and state.awake:
-                # Check timeout
-                elapsed = time.time() - state.last_command_time
-                if elapsed > COMMAND_TIMEOUT_SECONDS:
-                    logger.info("Command timeout — going back to sleep.")
-                    say(tts, f"I haven't heard anything for a while. Going to sleep. "
-                             f"Say 'okay {ROBOT_NAME.lower()}' to wake me again.")
-                    with state.lock:
-                        state.awake = False
-                        state.autonomous_mode = None
-                    reset_position(car)
-                    break
-
-                # Listen for a command
+                # Pull the next transcript from the STT pump; the short
+                # timeout keeps the awake/running checks responsive
+                # (the inactivity timeout itself is handled by the
+                # one-shot sleep timer).
                 try:
-                    result = stt.listen(stream=STT_STREAM_MODE)
-                    if isinstance(result, dict):
-                        text = result.get("text", "").strip()
-                    else:
-                        text = str(result).strip()
-                except Exception as e:
-                    logger.error("STT listen error: %s", e)
+                    result = stt_queue.get(timeout=1.0)
+                except queue.Empty:
+                    continue
+                if isinstance(result, Exception):
+                    logger.error("STT listen error: %s", result)
                     time.sleep(0.5)
                     continue
+                if isinstance(result, dict):
+                    text = result.get("text", "").strip()
+                else:
+                    text = str(result).strip()
 
                 if not text:
                     continue
 
-                # Update last command time
+                # Real speech arrived — push the sleep timeout out
                 with state.lock:
                     state.last_command_time = time.time()
+                arm_sleep_timer(car, tts)
 
                 # Check if wake word is in the text (re-trigger greeting)
-                is_wake = any(w in text.lower() for w in WAKE_WORDS)
+                is_wake = WAKE_RE.search(text.lower()) is not None
                 if is_wake:
                     say(tts, f"Yes, I'm here! What's up?")
                     continue
@@ -716,6 +1146,7 @@ def main():
     finally:
         shutdown()
         logger.info("Okay Robot system shut down. Goodbye!")
+        _log_listener.stop()  # drain queued records before exit
 
 
 if __name__ == "__main__":